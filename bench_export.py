@@ -0,0 +1,99 @@
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from database import Database
+from export import export_tasks, EXPORT_FORMATS
+
+CATEGORIES = ["Работа", "Личное", "Покупки", "Учёба", "Другое"]
+
+
+def build_database(db_file, tasks, users, batch=50000):
+    """Заполняет базу синтетическими задачами"""
+    db = Database(db_file)
+    db.init_db()
+    rnd = random.Random(42)
+    with db.get_connection() as conn:
+        c = conn.cursor()
+        for start in range(0, tasks, batch):
+            rows = [
+                (rnd.randrange(users),
+                 f"Синтетическая задача {i}",
+                 rnd.choice(CATEGORIES),
+                 f"2025-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d} 12:00:00",
+                 rnd.randint(1, 3),
+                 rnd.choice(('active', 'completed')))
+                for i in range(start, min(start + batch, tasks))
+            ]
+            c.executemany("""INSERT INTO tasks
+                            (user_id, task_text, category, deadline, priority, status)
+                            VALUES (?, ?, ?, ?, ?, ?)""", rows)
+            conn.commit()
+    return db
+
+
+def measure(label, func, rows=None):
+    """Замеряет скорость без трассировки, затем пиковую память под tracemalloc"""
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    line = f"{label:<28} {elapsed:8.2f} s  peak {peak / 1024 / 1024:8.2f} MiB"
+    if rows is None:
+        rows = result
+    if rows:
+        line += f"  {rows / elapsed:12,.0f} rows/s"
+    print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк экспорта и бэкапа базы задач")
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_file = os.path.join(workdir, 'bench.db')
+        started = time.perf_counter()
+        db = build_database(db_file, args.tasks, args.users)
+        print(f"Built {args.tasks:,} tasks in {time.perf_counter() - started:.2f} s "
+              f"({os.path.getsize(db_file) / 1024 / 1024:.1f} MiB)")
+
+        for fmt in EXPORT_FORMATS:
+            out_file = os.path.join(workdir, f"export.{fmt}")
+
+            def run(fmt=fmt, out_file=out_file, user_id=None):
+                with open(out_file, 'w', newline='', encoding='utf-8') as out:
+                    return export_tasks(db, out, fmt, user_id=user_id,
+                                        chunk_size=args.chunk_size)
+
+            measure(f"export all ({fmt})", run)
+            measure(f"export one user ({fmt})", lambda run=run: run(user_id=0))
+
+        def naive():
+            with db.get_connection() as conn:
+                return len(conn.execute("SELECT * FROM tasks").fetchall())
+
+        measure("naive SELECT * (baseline)", naive)
+
+        backup_file = os.path.join(workdir, 'backup.db')
+        measure("online backup", lambda: db.backup(backup_file), rows=args.tasks)
+        conn = sqlite3.connect(backup_file)
+        copied = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        conn.close()
+        print(f"Backup contains {copied:,} tasks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,29 @@
 import sqlite3
 import logging
 import datetime
+import os
+import pathlib
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+EXPORT_COLUMNS = ('id', 'user_id', 'task_text', 'category', 'deadline',
+                  'priority', 'status', 'reminder_sent')
+
 class Database:
     def __init__(self, db_file):
         self.db_file = db_file
 
     @contextmanager
-    def get_connection(self):
+    def get_connection(self, read_only=False):
         conn = None
         try:
-            conn = sqlite3.connect(self.db_file)
+            if read_only:
+                # В режиме только для чтения SQLite не создаёт отсутствующий файл
+                uri = pathlib.Path(self.db_file).absolute().as_uri() + "?mode=ro"
+                conn = sqlite3.connect(uri, uri=True)
+            else:
+                conn = sqlite3.connect(self.db_file)
             yield conn
         except Exception as e:
             logger.error(f"Database error: {e}")
@@ -218,4 +228,69 @@ class Database:
         with self.get_connection() as conn:
             c = conn.cursor()
             c.execute("UPDATE tasks SET reminder_sent = 1 WHERE id = ?", (task_id,))
-            conn.commit()
\ No newline at end of file
+            conn.commit()
+
+    def iter_tasks(self, user_id=None, chunk_size=1000):
+        """Постранично выдаёт задачи (одного пользователя или все) для экспорта.
+
+        Каждая порция читается отдельным коротким запросом по ключу id,
+        поэтому блокировка чтения не удерживается между порциями и не
+        мешает боту записывать задачи во время экспорта. Задачи, добавленные
+        после начала экспорта, в выгрузку не попадают.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        columns = ", ".join(EXPORT_COLUMNS)
+        if user_id is None:
+            query = f"""SELECT {columns} FROM tasks
+                        WHERE id > ? AND id <= ?
+                        ORDER BY id LIMIT ?"""
+            params = ()
+        else:
+            query = f"""SELECT {columns} FROM tasks
+                        WHERE user_id = ? AND id > ? AND id <= ?
+                        ORDER BY id LIMIT ?"""
+            params = (user_id,)
+
+        with self.get_connection(read_only=True) as conn:
+            c = conn.cursor()
+            c.execute("SELECT COALESCE(MAX(id), 0) FROM tasks")
+            max_id = c.fetchone()[0]
+            last_id = 0
+            while last_id < max_id:
+                c.execute(query, params + (last_id, max_id, chunk_size))
+                rows = c.fetchall()
+                if not rows:
+                    return
+                yield rows
+                last_id = rows[-1][0]
+
+    def backup(self, dest_file, pages=1024, sleep=0.05):
+        """Создаёт копию базы через онлайн-бэкап SQLite.
+
+        Копирование идёт шагами по ``pages`` страниц. Блокировка источника
+        снимается после каждого шага, поэтому бот может писать в базу во
+        время бэкапа; ``sleep`` — лишь пауза перед повтором шага, если база
+        занята. Запись из другого соединения заставляет SQLite начать
+        копирование заново. Копия сначала пишется во временный файл и
+        переименовывается в ``dest_file`` только если в ней есть таблица tasks.
+        """
+        tmp_file = f"{dest_file}.tmp"
+        dest = None
+        try:
+            dest = sqlite3.connect(tmp_file)
+            with self.get_connection(read_only=True) as conn:
+                conn.backup(dest, pages=pages, sleep=sleep)
+            c = dest.execute("""SELECT 1 FROM sqlite_master
+                                WHERE type = 'table' AND name = 'tasks'""")
+            if c.fetchone() is None:
+                raise sqlite3.DatabaseError(f"No tasks table in {self.db_file}")
+            dest.close()
+            dest = None
+            os.replace(tmp_file, dest_file)
+        except Exception:
+            if dest:
+                dest.close()
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
@@ -0,0 +1,104 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import sqlite3
+import sys
+from database import Database, EXPORT_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+
+
+def write_csv(chunks, out):
+    """Записывает порции задач в CSV, возвращает число строк"""
+    writer = csv.writer(out)
+    writer.writerow(EXPORT_COLUMNS)
+    count = 0
+    for rows in chunks:
+        writer.writerows(rows)
+        count += len(rows)
+    return count
+
+
+def write_jsonl(chunks, out):
+    """Записывает порции задач в JSON Lines, возвращает число строк"""
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    count = 0
+    for rows in chunks:
+        out.write("".join(
+            encode(dict(zip(EXPORT_COLUMNS, row))) + "\n"
+            for row in rows
+        ))
+        count += len(rows)
+    return count
+
+
+WRITERS = {
+    'csv': write_csv,
+    'jsonl': write_jsonl,
+}
+
+
+def export_tasks(db, out, fmt='csv', user_id=None, chunk_size=1000):
+    """Потоково выгружает задачи в открытый текстовый файл"""
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    return WRITERS[fmt](db.iter_tasks(user_id=user_id, chunk_size=chunk_size), out)
+
+
+def positive_int(value):
+    """Тип argparse для целых чисел больше нуля"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Экспорт и резервное копирование базы задач")
+    parser.add_argument('--db', default=os.getenv('DB_FILE', 'tasks.db'),
+                        help="путь к базе (по умолчанию DB_FILE или tasks.db)")
+    parser.add_argument('--output', '-o', required=True,
+                        help="файл для записи; '-' — stdout (только для экспорта)")
+    parser.add_argument('--format', '-f', choices=EXPORT_FORMATS, default='csv')
+    parser.add_argument('--user', type=int, default=None,
+                        help="выгрузить задачи только одного пользователя")
+    parser.add_argument('--chunk-size', type=positive_int, default=1000)
+    parser.add_argument('--backup', action='store_true',
+                        help="сделать полную копию базы через онлайн-бэкап SQLite")
+    parser.add_argument('--pages', type=positive_int, default=1024,
+                        help="страниц за один шаг бэкапа")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    if args.backup and args.output == '-':
+        parser.error("--backup requires a file path for --output")
+    if not os.path.isfile(args.db):
+        parser.error(f"database file not found: {args.db}")
+    db = Database(args.db)
+
+    try:
+        if args.backup:
+            db.backup(args.output, pages=args.pages)
+            logger.info(f"Backup of {args.db} written to {args.output}")
+            return 0
+
+        if args.output == '-':
+            count = export_tasks(db, sys.stdout, args.format, args.user, args.chunk_size)
+        else:
+            with open(args.output, 'w', newline='', encoding='utf-8') as out:
+                count = export_tasks(db, out, args.format, args.user, args.chunk_size)
+    except sqlite3.Error as e:
+        logger.error(f"Failed to read {args.db}: {e}")
+        return 1
+    logger.info(f"Exported {count} tasks to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
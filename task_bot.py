@@ -6,8 +6,11 @@ import datetime
 import time
 import os
 import threading
+import tempfile
+import io
 from config import *
 from database import Database
+from export import export_tasks, EXPORT_FORMATS
 
 # Настройка логирования
 logging.basicConfig(
@@ -42,10 +45,24 @@ class TelegramBot:
         def send_welcome(message):
             self.bot.send_message(
                 message.chat.id,
-                "Привет! Я бот-органайзер задач.",
+                "Привет! Я бот-органайзер задач.\n\n"
+                "📦 /export — выгрузить ваши задачи в CSV "
+                "(или /export jsonl — в JSON Lines)",
                 reply_markup=self.get_main_keyboard()
             )
 
+        @self.bot.message_handler(commands=['export'])
+        def export_user_tasks(message):
+            parts = message.text.split()
+            fmt = parts[1].lower() if len(parts) > 1 else 'csv'
+            if fmt not in EXPORT_FORMATS:
+                self.bot.send_message(
+                    message.chat.id,
+                    "❌ Неизвестный формат. Используйте: /export csv или /export jsonl"
+                )
+                return
+            self.send_export(message.chat.id, message.from_user.id, fmt)
+
         @self.bot.message_handler(func=lambda message: message.text == "📝 Добавить задачу")
         def add_task(message):
             msg = self.bot.send_message(message.chat.id, "Введите текст задачи:")
@@ -195,6 +212,28 @@ class TelegramBot:
                     "У вас пока нет завершенных задач."
                 )
 
+    def send_export(self, chat_id, user_id, fmt):
+        """Выгружает задачи пользователя во временный файл и отправляет его"""
+        try:
+            with tempfile.TemporaryFile('w+b') as tmp:
+                out = io.TextIOWrapper(tmp, encoding='utf-8', newline='')
+                count = export_tasks(self.db, out, fmt, user_id=user_id)
+                out.flush()
+                out.detach()
+                if not count:
+                    self.bot.send_message(chat_id, "У вас пока нет задач для экспорта.")
+                    return
+                tmp.seek(0)
+                self.bot.send_document(
+                    chat_id,
+                    tmp,
+                    visible_file_name=f"tasks.{fmt}",
+                    caption=f"📦 Экспортировано задач: {count}"
+                )
+        except Exception as e:
+            logger.error(f"Error exporting tasks for user {user_id}: {e}")
+            self.bot.send_message(chat_id, "❌ Ошибка при экспорте задач")
+
     def process_task_text(self, message):
         user_id = message.from_user.id
         self.user_states[user_id] = {